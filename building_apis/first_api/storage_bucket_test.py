@@ -1,12 +1,50 @@
-from google.cloud import storage
-
-client = storage.Client()
-
-# Create a new storage bucket
-new_bucket = client.create_bucket("hello-world-2-storage")
-
-# create a blob(file) to be uploaded
-new_blob= new_bucket.blob("test-folder/manage.py")
-
-# upload the file
-new_blob.upload_from_filename(filename="first_api/manage.py")
\ No newline at end of file
+import functools
+import os
+
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from google.cloud.storage.retry import DEFAULT_RETRY
+from requests.adapters import HTTPAdapter
+
+# Files above this size are uploaded as parallel chunks instead of one request.
+# Matches the library's 8 MB limit for single request (multipart) uploads.
+LARGE_FILE_SIZE = 8 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Return a shared storage client whose HTTP session keeps connections alive"""
+    credentials, project = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials, refresh_status_codes=(401,))
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    return storage.Client(project=project, credentials=credentials, _http=session)
+
+
+def main():
+    client = get_client()
+    
+    # Create a new storage bucket
+    new_bucket = client.create_bucket("hello-world-2-storage")
+    
+    # create a blob(file) to be uploaded
+    new_blob= new_bucket.blob("test-folder/manage.py", chunk_size=None)
+    
+    # upload the file
+    file_path = "first_api/manage.py"
+    file_size = os.path.getsize(file_path)
+    if file_size > LARGE_FILE_SIZE:
+        # Upload parts concurrently using the XML multipart upload API
+        transfer_manager.upload_chunks_concurrently(file_path, new_blob)
+    else:
+        # Passing the size lets the client send the file in a single request
+        # Retry explicitly, the default policy only retries with a precondition set
+        with open(file_path, "rb") as file_obj:
+            new_blob.upload_from_file(file_obj, size=file_size, checksum="crc32c",
+                                      retry=DEFAULT_RETRY)
+
+
+# Worker processes re-import this module, so only run the upload when executed
+if __name__ == "__main__":
+    main()
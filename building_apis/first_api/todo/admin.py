@@ -1,7 +1,23 @@
 from django.contrib import admin
-from .models import Todo
+from .models import Todo, Contact
 
 @admin.register(Todo)
 class TodoAdmin(admin.ModelAdmin):
+    list_display = ('task', 'completed', 'created')
+    list_select_related = True
+    list_per_page = 50
+    search_fields = ('task',)
+    
     class Meta:
         model = Todo
+
+
+@admin.register(Contact)
+class ContactAdmin(admin.ModelAdmin):
+    list_display = ('name', 'phone_number', 'email')
+    list_select_related = True
+    list_per_page = 50
+    search_fields = ('name', 'phone_number', 'email')
+    
+    class Meta:
+        model = Contact
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.1 on 2026-10-15 04:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo", "0004_contact"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(
+                fields=("phone_number",), name="uniq_phone"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(fields=("email",), name="uniq_email"),
+        ),
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(
+                fields=("name", "phone_number"), name="uniq_name_phone"
+            ),
+        ),
+    ]
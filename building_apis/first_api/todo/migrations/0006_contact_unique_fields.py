@@ -0,0 +1,31 @@
+# Generated by Django 4.2.1 on 2026-10-15 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo", "0005_contact_constraints"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="contact",
+            name="uniq_phone",
+        ),
+        migrations.RemoveConstraint(
+            model_name="contact",
+            name="uniq_email",
+        ),
+        migrations.AlterField(
+            model_name="contact",
+            name="email",
+            field=models.EmailField(max_length=254, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="contact",
+            name="phone_number",
+            field=models.CharField(max_length=20, unique=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.1 on 2026-10-15 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo", "0006_contact_unique_fields"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="todo",
+            name="created",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
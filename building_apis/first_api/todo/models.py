@@ -5,7 +5,8 @@ class Todo(models.Model):
     
     task = models.CharField(max_length=200, null=True, unique=True)
     details = models.CharField(max_length=500)
-    created = models.DateTimeField(auto_now_add=True)
+    # Indexed so paginated listings ordered by -created avoid a full sort
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
     completed = models.BooleanField(default=False)
     updated = models.DateTimeField(auto_now=True)
     
@@ -15,8 +16,16 @@ class Todo(models.Model):
 
 class Contact(models.Model):
     name = models.CharField(max_length=50)
-    phone_number = models.CharField(max_length=20)
-    email = models.EmailField()
+    # unique=True gives both columns an index for the uniqueness lookups
+    phone_number = models.CharField(max_length=20, unique=True)
+    email = models.EmailField(unique=True)
+    
+    class Meta:
+        # Uniqueness is enforced by the database instead of serializer queries
+        constraints = [
+            # Also serves as the index for (name, phone_number) lookups
+            models.UniqueConstraint(fields=['name', 'phone_number'], name='uniq_name_phone'),
+        ]
     
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
@@ -0,0 +1,6 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ContactCursorPagination(CursorPagination):
+    """Contacts have no created field, so page through them by primary key"""
+    ordering = '-id'
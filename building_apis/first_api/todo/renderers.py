@@ -0,0 +1,18 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Renders responses to JSON bytes using orjson instead of the json module"""
+    media_type = 'application/json'
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        option = orjson.OPT_NON_STR_KEYS
+        # orjson only supports a two space indent, used for any requested indent
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        # Fall back to DRF's encoder for types orjson does not handle natively
+        return orjson.dumps(data, default=JSONEncoder().default, option=option)
@@ -1,41 +1,107 @@
+import copy
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from .models import Todo, Contact
+from .exceptions import NotAcceptable
+
+class TodoReadSerializer(serializers.ModelSerializer):
+    """Processes the model into JSON using the defined fields (read only)"""
+    class Meta:
+        model = Todo
+        fields = ['task', 'details', 'completed']
+        # Read only fields skip the validation machinery when listing
+        read_only_fields = fields
+    
+    # Field map built from the model on first use
+    _cached_fields = None
+    
+    def get_fields(self):
+        """Introspect the model once and hand out copies of the fields"""
+        cls = type(self)
+        if cls.__dict__.get('_cached_fields') is None:
+            cls._cached_fields = super().get_fields()
+        return copy.deepcopy(cls._cached_fields)
+
+
+class TodoValuesSerializer(serializers.Serializer):
+    """Processes todo dicts from QuerySet.values() into JSON (read only)"""
+    task = serializers.CharField(read_only=True)
+    details = serializers.CharField(read_only=True)
+    completed = serializers.BooleanField(read_only=True)
 
-# Import Validation classes from rest framework
-from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
 
-class TodoSerializer(serializers.ModelSerializer):
-    """Processes the model into JSON using the defined fields"""
+class TodoBulkCreateSerializer(serializers.ListSerializer):
+    """Creates a list of todo items with a single bulk INSERT"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # validate() checks every task in one query instead of one per item
+        task = self.child.fields['task']
+        task.validators = [validator for validator in task.validators
+                           if not isinstance(validator, UniqueValidator)]
+    
+    def validate(self, attrs):
+        """Reject tasks that already exist using a single query"""
+        tasks = [item['task'] for item in attrs if item.get('task') is not None]
+        existing = Todo.objects.filter(task__in=tasks).values_list('task', flat=True)
+        if existing:
+            raise serializers.ValidationError(
+                {'task': [f"todo with task '{task}' already exists." for task in existing]}
+            )
+        return attrs
+    
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return Todo.objects.bulk_create(
+                    [Todo(**item) for item in validated_data], batch_size=500
+                )
+        except IntegrityError:
+            raise NotAcceptable(detail="we cannot accept this because tasks must be unique")
+
+
+class TodoWriteSerializer(serializers.ModelSerializer):
+    """Validates incoming data and creates/updates todo items"""
     class Meta:
         model = Todo
         fields = ['task', 'details', 'completed']
+        # Used when the serializer is created with many=True
+        list_serializer_class = TodoBulkCreateSerializer
         
         
-class ContactSerializer(serializers.Serializer):
-    name = serializers.CharField()
-    phone_number = serializers.CharField(validators=[
-        # This validator must be added to the serializer field directly
-        UniqueValidator(queryset=Contact.objects.all(),
-                        message="Phone number already entered")
-        ])
-    email = serializers.EmailField(validators=[
-        UniqueValidator(queryset=Contact.objects.all(),
-                        message="Email is already used")
-    ])
-    
+class ContactSerializer(serializers.ModelSerializer):
+    """Processes contacts into JSON and creates new ones"""
     class Meta:
-        validators = [
-            UniqueTogetherValidator(
-                queryset=Contact.objects.all(),
-                # The fields must exist as fields in the serializer class
-                fields=['name', 'phone_number'],
-                # optional argument
-                message="No Phone number can have 2 different names"
-            )
-        ]
+        model = Contact
+        # Uniqueness of phone_number, email and (name, phone_number) is
+        # enforced by the constraints on the Contact model
+        fields = ['name', 'phone_number', 'email']
+        # Skip the UniqueValidator queries ModelSerializer adds for unique fields
+        extra_kwargs = {
+            'phone_number': {'validators': []},
+            'email': {'validators': []},
+        }
     
-    # Used mainly for the basic Serializer class or custom use cases
     def create(self, validated_data):
-        """Create a new Contact object after data has been validated"""
-        return Contact.objects.create(**validated_data)
-        
\ No newline at end of file
+        """Create a new Contact object, reporting duplicates as NotAcceptable"""
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise NotAcceptable(detail=self.get_conflicts(validated_data))
+    
+    def get_conflicts(self, attrs):
+        """Find which unique values clash with existing contacts in one query"""
+        # A (name, phone_number) clash is always a phone_number clash as well
+        conflicts = Contact.objects.filter(
+            Q(phone_number=attrs['phone_number']) | Q(email=attrs['email'])
+        ).values('phone_number', 'email')
+        errors = {}
+        for contact in conflicts:
+            if contact['phone_number'] == attrs['phone_number']:
+                errors['phone_number'] = "Phone number already entered"
+            if contact['email'] == attrs['email']:
+                errors['email'] = "Email is already used"
+        return errors or "Phone number or email already entered"
@@ -1,3 +1,95 @@
-from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from .models import Todo
+
+
+class TodoBulkCreateTests(APITestCase):
+    """Posting a list of todos to the todo list endpoint"""
+    
+    url = reverse('todo:todo-list')
+    
+    def test_creates_all_todos(self):
+        data = [{'task': f'task {i}', 'details': 'details'} for i in range(3)]
+        response = self.client.post(self.url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(Todo.objects.count(), 3)
+    
+    def test_query_count_does_not_grow_with_batch_size(self):
+        data = [{'task': f'task {i}', 'details': 'details'} for i in range(50)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertLess(len(queries), 10)
+    
+    def test_rejects_existing_task(self):
+        Todo.objects.create(task='task 0', details='details')
+        data = [{'task': f'task {i}', 'details': 'details'} for i in range(2)]
+        response = self.client.post(self.url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.assertEqual(response.data, {'task': ["todo with task 'task 0' already exists."]})
+        self.assertEqual(Todo.objects.count(), 1)
+    
+    def test_rejects_duplicate_task_in_batch(self):
+        data = [{'task': 'task', 'details': 'details'}] * 2
+        response = self.client.post(self.url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.assertEqual(response.data,
+                         {'detail': "we cannot accept this because tasks must be unique"})
+        self.assertEqual(Todo.objects.count(), 0)
+
+
+class ORJSONRendererTests(APITestCase):
+    """Rendering JSON responses with orjson"""
+    
+    url = reverse('todo:todo-list')
+    
+    def setUp(self):
+        Todo.objects.create(task='task', details='details')
+    
+    def test_renders_compact_json_by_default(self):
+        response = self.client.get(self.url, HTTP_ACCEPT='application/json')
+        
+        self.assertNotIn(b'\n', response.content)
+    
+    def test_indents_when_requested(self):
+        response = self.client.get(self.url, HTTP_ACCEPT='application/json; indent=4')
+        
+        self.assertIn(b'\n  "next"', response.content)
+
+
+class TodoCreateErrorTests(APITestCase):
+    """Error messages when posting a single invalid todo"""
+    
+    url = reverse('todo:todo-list')
+    
+    def test_missing_details(self):
+        response = self.client.post(self.url, {'task': 'task'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.assertEqual(response.data['detail'],
+                         "we cannot accept this because details field is required")
+    
+    def test_blank_details(self):
+        response = self.client.post(self.url, {'task': 'task', 'details': ''}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.assertEqual(response.data['detail'],
+                         "we cannot accept this because details field is required")
+    
+    def test_details_too_long(self):
+        data = {'task': 'task', 'details': 'x' * 600}
+        response = self.client.post(self.url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.assertEqual(response.data['detail'],
+                         "we cannot accept this because details field is invalid: "
+                         "Ensure this field has no more than 500 characters.")
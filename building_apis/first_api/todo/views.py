@@ -2,37 +2,60 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from .models import Todo, Contact
-from .serializers import TodoSerializer, ContactSerializer
+from .serializers import (TodoReadSerializer, TodoValuesSerializer, TodoWriteSerializer,
+                          ContactSerializer)
 # Permissions classes from rest_framework
-from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, SAFE_METHODS
 # Import Concrete Generic Views
 from rest_framework import generics
 # Import custom exceptions
 from .exceptions import CustomException, NotAcceptable
+from .pagination import ContactCursorPagination
 
+# Detail message for the most common invalid todo request
+DETAILS_REQUIRED = "we cannot accept this because details field is required"
 
-class TodoListApiView(APIView):
+
+class TodoListApiView(generics.ListCreateAPIView):
     """
     List all todo items using the get method.
     Create a new todo using the post method.
     """
     
+    serializer_class = TodoWriteSerializer
     # permission_classes = [IsAuthenticatedOrReadOnly]
     
+    def get_queryset(self):
+        """Read todos as plain dicts, skipping model instantiation."""
+        # 'created' is included because the cursor pagination orders by it
+        return Todo.objects.values('task', 'details', 'completed', 'created')
+    
+    def get_serializer_class(self):
+        """Use the dict based serializer for safe methods."""
+        if self.request.method in SAFE_METHODS:
+            return TodoValuesSerializer
+        return super().get_serializer_class()
+    
     def get(self, request, *args, **kwargs):
         """
         List all the todo items
         """
         # Get all todos
-        todos = Todo.objects.all()
+        todos = self.get_queryset()
+        
+        # Only serialize the current page of todos
+        page = self.paginate_queryset(todos)
+        if page is None:
+            # Pagination is turned off, stream rows in chunks to cap memory
+            serializer = self.get_serializer(todos.iterator(chunk_size=2000), many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
         
         # Validate the data using the serializer
-        serializer = TodoSerializer(todos, many=True)
-        print(serializer.data)
+        serializer = self.get_serializer(page, many=True)
         
         # Return data and status code
         # raise CustomException
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.get_paginated_response(serializer.data)
         
     def post(self, request, *args, **kwargs):
         """
@@ -46,8 +69,13 @@ class TodoListApiView(APIView):
         #     'completed': request.data.get('completed')
         # }
         
+        # Reject a todo without details before building the serializer
+        if isinstance(request.data, dict) and 'details' not in request.data:
+            raise NotAcceptable(detail=DETAILS_REQUIRED)
+        
         # Pass the data dictionary to the serializer
-        serializer = TodoSerializer(data=request.data)
+        # A list of todos is created in bulk
+        serializer = TodoWriteSerializer(data=request.data, many=isinstance(request.data, list))
         
         # Check if data passed through serializer is valid
         if serializer.is_valid():
@@ -58,9 +86,16 @@ class TodoListApiView(APIView):
             # Return the serialized and status code
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         
-        errors = serializer.errors['details'][0]
-        errors = "details field is required"
-        raise NotAcceptable(detail=f"we cannot accept this because {errors}")
+        # Only a dict of errors (single todo) can have a 'details' entry
+        errors = serializer.errors
+        if isinstance(errors, dict) and 'details' in errors:
+            error = errors['details'][0]
+            if error.code in ('required', 'blank'):
+                raise NotAcceptable(detail=DETAILS_REQUIRED)
+            raise NotAcceptable(detail=f"we cannot accept this because details field is invalid: {error}")
+        
+        # Any other invalid field is reported as it is
+        raise NotAcceptable(detail=errors)
             
         # if data is not valid return errors and error code
         # return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)  
@@ -68,7 +103,7 @@ class TodoListApiView(APIView):
 ### Listing view using Generic Views
 # class TodoListApiView(generics.ListCreateAPIView):
 #     queryset = Todo.objects.all()
-#     serializer_class = TodoSerializer
+#     serializer_class = TodoWriteSerializer
 #     # permission_classes = [IsAuthenticatedOrReadOnly]
 #     allowed_methods = ['GET', 'POST']
      
@@ -148,12 +183,25 @@ class TodoListApiView(APIView):
 
 class TodoDetailApiView(generics.RetrieveUpdateDestroyAPIView): 
     queryset = Todo.objects.all()
-    serializer_class = TodoSerializer
+    serializer_class = TodoWriteSerializer
     allowed_methods = ['GET', 'PUT', 'DELETE'] 
     
+    def get_serializer_class(self):
+        """Use the read only serializer for safe methods."""
+        if self.request.method in SAFE_METHODS:
+            return TodoReadSerializer
+        return super().get_serializer_class()
+    
+    def get_queryset(self):
+        """Only load the serialized columns when reading a todo."""
+        if self.request.method in SAFE_METHODS:
+            return Todo.objects.only('task', 'details', 'completed')
+        return super().get_queryset()
+    
     
 class ContactApiView(generics.ListCreateAPIView):
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
+    pagination_class = ContactCursorPagination
         
       
\ No newline at end of file